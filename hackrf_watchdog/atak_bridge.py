@@ -1,16 +1,33 @@
 import json
 import os
 import socket
+import threading
 import time
 import uuid
 import ipaddress
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from xml.sax.saxutils import escape
 from PyQt5 import QtCore, QtWidgets
 
 
+# Static CoT XML fragments, encoded once. Dynamic values are slotted in between
+# and the whole event goes out as a scatter/gather send where supported.
+_COT_UID = b'<event version="2.0"\n    uid="'
+_COT_TYPE = b'"\n    type="'
+_COT_TIME = b'"\n    how="m-g"\n    time="'
+_COT_START = b'"\n    start="'
+_COT_STALE = b'"\n    stale="'
+_COT_LAT = b'">\n  <point lat="'
+_COT_LON = b'" lon="'
+_COT_CALLSIGN = b'" hae="0" ce="9999999" le="9999999" />\n  <detail>\n    <contact callsign="'
+_COT_GROUP = b'" />\n    <__group name="'
+_COT_ROLE = b'" role="'
+_COT_REMARKS = b'" />\n    <remarks>'
+_COT_END = b'</remarks>\n  </detail>\n</event>'
+
+
 def _config_path() -> str:
     base = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.AppDataLocation)
     os.makedirs(base, exist_ok=True)
@@ -102,6 +119,8 @@ class AtakBridge(QtCore.QObject):
         super().__init__(parent)
         self.cfg = load_config()
         self._sock: Optional[socket.socket] = None
+        # Sends may come from worker threads; guard lazy socket creation.
+        self._sock_lock = threading.Lock()
         self._last_sent_by_key: Dict[str, float] = {}
         self._auto_local_ip_cache: Optional[str] = None
 
@@ -121,12 +140,13 @@ class AtakBridge(QtCore.QObject):
         self.status_changed.emit("Settings saved")
 
     def _reset_socket(self) -> None:
-        try:
-            if self._sock:
-                self._sock.close()
-        except Exception:
-            pass
-        self._sock = None
+        with self._sock_lock:
+            try:
+                if self._sock:
+                    self._sock.close()
+            except Exception:
+                pass
+            self._sock = None
 
     def _is_multicast_host(self) -> bool:
         try:
@@ -153,9 +173,13 @@ class AtakBridge(QtCore.QObject):
         return auto_ip
 
     def _get_socket(self) -> socket.socket:
-        if self._sock:
+        with self._sock_lock:
+            if self._sock:
+                return self._sock
+            self._sock = self._create_socket()
             return self._sock
 
+    def _create_socket(self) -> socket.socket:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
 
         # Only apply multicast options if destination is multicast
@@ -173,42 +197,47 @@ class AtakBridge(QtCore.QObject):
                 except Exception:
                     pass
 
-        self._sock = s
         return s
 
     @staticmethod
     def _iso_z_ms(t: float) -> str:
         return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(t))
 
-    def _build_cot(self, uid: str, callsign: str, remarks: str) -> bytes:
+    def _build_cot_parts(self, uid: str, callsign: str, remarks: str) -> List[bytes]:
         now = time.time()
-        t = self._iso_z_ms(now)
-        stale = self._iso_z_ms(now + max(5, int(self.cfg.stale_seconds)))
-
-        uid_esc = escape(uid)
-        callsign_esc = escape(callsign)
-        remarks_esc = escape(remarks) if remarks else ""
-
-        xml = f"""<event version="2.0"
-    uid="{uid_esc}"
-    type="{escape(self.cfg.cot_type)}"
-    how="m-g"
-    time="{t}"
-    start="{t}"
-    stale="{stale}">
-  <point lat="{self.cfg.lat:.6f}" lon="{self.cfg.lon:.6f}" hae="0" ce="9999999" le="9999999" />
-  <detail>
-    <contact callsign="{callsign_esc}" />
-    <__group name="{escape(self.cfg.group_name)}" role="{escape(self.cfg.group_role)}" />
-    <remarks>{remarks_esc}</remarks>
-  </detail>
-</event>"""
-        return xml.encode("utf-8")
-
-    def _send_raw(self, payload: bytes, emit_success_status: bool = False, success_label: str = "") -> None:
+        t = self._iso_z_ms(now).encode("ascii")
+        stale = self._iso_z_ms(now + max(5, int(self.cfg.stale_seconds))).encode("ascii")
+
+        return [
+            _COT_UID, escape(uid).encode("utf-8"),
+            _COT_TYPE, escape(self.cfg.cot_type).encode("utf-8"),
+            _COT_TIME, t,
+            _COT_START, t,
+            _COT_STALE, stale,
+            _COT_LAT, f"{self.cfg.lat:.6f}".encode("ascii"),
+            _COT_LON, f"{self.cfg.lon:.6f}".encode("ascii"),
+            _COT_CALLSIGN, escape(callsign).encode("utf-8"),
+            _COT_GROUP, escape(self.cfg.group_name).encode("utf-8"),
+            _COT_ROLE, escape(self.cfg.group_role).encode("utf-8"),
+            _COT_REMARKS, escape(remarks).encode("utf-8") if remarks else b"",
+            _COT_END,
+        ]
+
+    def _send_raw(self, payload: Union[bytes, List[bytes]], emit_success_status: bool = False, success_label: str = "") -> None:
+        """
+        Send one CoT event. `payload` is either bytes or a list of byte
+        fragments; fragments go out via sendmsg() without joining them first
+        (falls back to a joined sendto() where sendmsg is unavailable, e.g. Windows).
+        """
         try:
             s = self._get_socket()
-            s.sendto(payload, (self.cfg.host, int(self.cfg.port)))
+            addr = (self.cfg.host, int(self.cfg.port))
+            if isinstance(payload, (bytes, bytearray)):
+                s.sendto(payload, addr)
+            elif hasattr(s, "sendmsg"):
+                s.sendmsg(payload, [], 0, addr)
+            else:
+                s.sendto(b"".join(payload), addr)
 
             if emit_success_status:
                 via = self.resolve_local_ip_for_send()
@@ -220,6 +249,45 @@ class AtakBridge(QtCore.QObject):
             via_txt = f" via {via}" if via else ""
             self.status_changed.emit(f"Send failed: {e} (to {self.cfg.host}:{self.cfg.port}{via_txt})")
 
+    def _send_many(self, payloads: List[List[bytes]]) -> None:
+        """
+        Send several CoT events with one socket lookup and at most one status
+        emit. Each event is still its own datagram: CoT receivers parse one
+        event per UDP packet.
+        """
+        failed = 0
+        error: Optional[Exception] = None
+        try:
+            s = self._get_socket()
+            addr = (self.cfg.host, int(self.cfg.port))
+            if hasattr(s, "sendmsg"):
+                sendmsg = s.sendmsg
+                for parts in payloads:
+                    try:
+                        sendmsg(parts, [], 0, addr)
+                    except Exception as e:
+                        failed += 1
+                        error = e
+            else:
+                sendto = s.sendto
+                for parts in payloads:
+                    try:
+                        sendto(b"".join(parts), addr)
+                    except Exception as e:
+                        failed += 1
+                        error = e
+        except Exception as e:
+            failed = len(payloads)
+            error = e
+
+        if failed:
+            via = self.resolve_local_ip_for_send()
+            via_txt = f" via {via}" if via else ""
+            self.status_changed.emit(
+                f"Send failed: {error} ({failed} of {len(payloads)} events, "
+                f"to {self.cfg.host}:{self.cfg.port}{via_txt})"
+            )
+
     def _extract_freq_mhz(self, det: Dict[str, Any]) -> float:
         if "freq_mhz" in det:
             try:
@@ -251,7 +319,7 @@ class AtakBridge(QtCore.QObject):
             self.status_changed.emit("Bridge is disabled (enable it to send)")
             return
 
-        cot = self._build_cot(
+        cot = self._build_cot_parts(
             uid=self.cfg.static_uid,
             callsign=self.cfg.static_callsign,
             remarks="CoT test from HackRF-Watchdog",
@@ -262,6 +330,26 @@ class AtakBridge(QtCore.QObject):
         if not self.cfg.enabled:
             return
 
+        cot = self._detection_cot_parts(det, noise_floor)
+        if cot is not None:
+            # Do NOT emit success status here (would spam), but we DO emit errors if they happen.
+            self._send_raw(cot, emit_success_status=False)
+
+    def send_detections_batch(self, detections: List[Dict[str, Any]], noise_floor: Optional[float] = None) -> None:
+        """Like send_detection() for a burst of detections, sent back to back."""
+        if not self.cfg.enabled:
+            return
+
+        payloads = []
+        for det in detections:
+            cot = self._detection_cot_parts(det, noise_floor)
+            if cot is not None:
+                payloads.append(cot)
+        if payloads:
+            self._send_many(payloads)
+
+    def _detection_cot_parts(self, det: Dict[str, Any], noise_floor: Optional[float]) -> Optional[List[bytes]]:
+        """CoT fragments for one detection, or None while its marker is rate limited."""
         fmhz = self._extract_freq_mhz(det)
         callsign, uid = self.preview_identity(fmhz if fmhz > 0 else 0.0)
         key = uid
@@ -269,7 +357,7 @@ class AtakBridge(QtCore.QObject):
         now = time.time()
         last = self._last_sent_by_key.get(key, 0.0)
         if now - last < 1.0:
-            return
+            return None
         self._last_sent_by_key[key] = now
 
         parts = []
@@ -325,10 +413,7 @@ class AtakBridge(QtCore.QObject):
             parts.append(f"Band: {band}")
 
         remarks = " | ".join(parts) if parts else "HackRF-Watchdog detection"
-        cot = self._build_cot(uid=uid, callsign=callsign, remarks=remarks)
-
-        # Do NOT emit success status here (would spam), but we DO emit errors if they happen.
-        self._send_raw(cot, emit_success_status=False)
+        return self._build_cot_parts(uid=uid, callsign=callsign, remarks=remarks)
 
 
 ATAK_GROUP_COLORS = [
@@ -0,0 +1,154 @@
+"""
+Latest detection per frequency, kept as parallel NumPy arrays.
+
+No Qt here: the GUI wraps the store in a table model (main.DetectionModel).
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+def freq_key_hz(freq_mhz: float) -> int:
+    """Integer-Hz key for a detection frequency (stable, cheap to hash)."""
+    return int(round(freq_mhz * 1_000_000))
+
+
+def _strongest_per_key(detections: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collapse a burst of detections to one entry per freq_key_hz(), in
+    first-seen order: (keys, index of the strongest hit, index of the last
+    hit). Ties go to the earlier hit, as in a one-by-one merge.
+    """
+    n = len(detections)
+    freqs = np.fromiter((d["freq_mhz"] for d in detections), dtype=np.float64, count=n)
+    powers = np.fromiter((d["power_dbm"] for d in detections), dtype=np.float64, count=n)
+    # np.rint rounds half to even, like round() in freq_key_hz().
+    keys = np.rint(freqs * 1_000_000).astype(np.int64)
+
+    order = np.lexsort((np.arange(n), -powers, keys))
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    best = order[starts]
+    last = np.maximum.reduceat(order, starts)
+    seq = np.argsort(np.minimum.reduceat(order, starts), kind="stable")
+    return sorted_keys[starts][seq], best[seq], last[seq]
+
+
+class DetectionStore:
+    """
+    Latest detection per frequency. The hot fields (freq, power, timestamp)
+    live in parallel arrays so sorting and ages are vectorized; the full
+    detection dict (for ATAK etc.) is kept in a parallel list.
+
+    Array timestamps are time.monotonic() receive times, so ages are immune
+    to wall-clock jumps; the detection dicts keep their wall-clock timestamp.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._n = 0
+        self._freqs_hz = np.empty(capacity, dtype=np.int64)
+        self._powers = np.empty(capacity, dtype=np.float32)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._index: Dict[int, int] = {}
+        self.info: List[Dict[str, Any]] = []
+        # Row indices, newest first; kept up to date by merge() so the
+        # table never has to re-sort the whole store.
+        self._order = np.empty(0, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def freqs_hz(self) -> np.ndarray:
+        return self._freqs_hz[: self._n]
+
+    @property
+    def powers(self) -> np.ndarray:
+        return self._powers[: self._n]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[: self._n]
+
+    def clear(self) -> None:
+        self._n = 0
+        self._index.clear()
+        self.info.clear()
+        self._order = np.empty(0, dtype=np.intp)
+
+    def _grow(self) -> None:
+        cap = self._freqs_hz.size * 2
+        self._freqs_hz = np.resize(self._freqs_hz, cap)
+        self._powers = np.resize(self._powers, cap)
+        self._timestamps = np.resize(self._timestamps, cap)
+
+    def merge(self, detections: List[Dict[str, Any]], seen: float) -> None:
+        """Keep the strongest hit per frequency; weaker hits only refresh its timestamp."""
+        if not detections:
+            return
+        # Bursts repeat the same bins frame after frame; reduce them in numpy
+        # so the Python loop below runs once per frequency, not once per hit.
+        keys, best, last = _strongest_per_key(detections)
+
+        index_get = self._index.get
+        info = self.info
+        powers = self._powers
+        touched = []
+        append = touched.append
+        for freq, b, l in zip(keys.tolist(), best.tolist(), last.tolist()):
+            d = detections[b]
+            power = d["power_dbm"]
+            i = index_get(freq)
+            if i is None:
+                i = self._n
+                if i == self._freqs_hz.size:
+                    self._grow()
+                    powers = self._powers
+                self._index[freq] = i
+                self._freqs_hz[i] = freq
+                powers[i] = power
+                info.append(d)
+                self._n += 1
+            elif power > powers[i]:
+                powers[i] = power
+                info[i] = d
+            else:
+                info[i]["timestamp"] = d["timestamp"]
+            if l != b:
+                info[i]["timestamp"] = detections[l]["timestamp"]
+            append(i)
+
+        if touched:
+            rows = np.unique(np.asarray(touched, dtype=np.intp))
+            self._timestamps[rows] = seen
+            self._promote(rows)
+
+    def _promote(self, rows: np.ndarray) -> None:
+        """Move `rows` (sorted, all stamped with the same time) to the front."""
+        old = self._order
+        keep = np.ones(self._n, dtype=bool)
+        keep[rows] = False
+        self._order = np.concatenate((rows, old[keep[old]]))
+
+    def newest_first(self) -> np.ndarray:
+        """Row indices ordered by most recent timestamp (ties by row)."""
+        return self._order
+
+    def prune(self, cutoff: float) -> int:
+        """Drop entries last seen before `cutoff`; returns how many were dropped."""
+        n = self._n
+        # The oldest entry is last in the maintained order.
+        if not n or self._timestamps[self._order[-1]] >= cutoff:
+            return 0
+
+        keep = self._timestamps[:n] >= cutoff
+        kept = int(np.count_nonzero(keep))
+        new_row = np.cumsum(keep) - 1
+        self._order = new_row[self._order[keep[self._order]]]
+        for arr in (self._freqs_hz, self._powers, self._timestamps):
+            arr[:kept] = arr[:n][keep]
+        self.info = [d for d, k in zip(self.info, keep.tolist()) if k]
+        self._index = {f: i for i, f in enumerate(self._freqs_hz[:kept].tolist())}
+        self._n = kept
+        return n - kept
@@ -1,5 +1,7 @@
 import subprocess
-from typing import Iterable, List, Tuple, Dict, Generator
+from typing import Iterable, Tuple, Dict, Generator
+
+import numpy as np
 
 
 class SweepBackendError(Exception):
@@ -7,7 +9,7 @@ class SweepBackendError(Exception):
     pass
 
 
-def parse_hackrf_sweep_line(line: str) -> Tuple[float, float, float, float, List[float]]:
+def parse_hackrf_sweep_line(line: str) -> Tuple[float, float, float, float, np.ndarray]:
     """
     Parse one line of hackrf_sweep output.
 
@@ -15,16 +17,17 @@ def parse_hackrf_sweep_line(line: str) -> Tuple[float, float, float, float, List
       date, time, hz_low, hz_high, hz_bin_width, num_samples, dB, dB, ...
 
     Returns:
-      (timestamp_s, hz_low, hz_high, hz_bin_width, [power_dbm...])
+      (timestamp_s, hz_low, hz_high, hz_bin_width, float32 array of power_dbm)
     """
-    parts = line.strip().split(",")
+    parts = line.strip().split(",", 6)
     if len(parts) < 7:
         raise ValueError(f"Not enough columns in sweep line: {line!r}")
 
     hz_low = float(parts[2].strip())
     hz_high = float(parts[3].strip())
     hz_bin_width = float(parts[4].strip())
-    power_vals = [float(p.strip()) for p in parts[6:]]
+    # Converted in one NumPy call; a malformed value raises ValueError.
+    power_vals = np.array(parts[6].split(","), dtype=np.float32)
 
     # Placeholder timestamp in seconds (can be improved later).
     timestamp_s = 0.0
@@ -46,7 +49,7 @@ def iter_sweep_frames(
         "low_hz": float,
         "high_hz": float,
         "bin_width_hz": float,
-        "powers_dbm": [float, ...]
+        "powers_dbm": np.ndarray (float32)
       }
 
     Raises SweepBackendError if hackrf_sweep exits without producing any data.
@@ -1,24 +1,86 @@
 import sys
+import re
 import time
-import statistics
+import bisect
+import collections
+import functools
 import subprocess
 import os
 import shutil
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, replace
+from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtMultimedia import QSoundEffect
 
 from hackrf_watchdog.sweep_backend import iter_sweep_frames, SweepBackendError
 from hackrf_watchdog.atak_bridge import AtakBridge, AtakBridgeWindow
+from hackrf_watchdog.detection_store import DetectionStore, freq_key_hz
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOUNDS_DIR = os.path.join(BASE_DIR, "sounds")
+
+# Beep mode -> WAV file under SOUNDS_DIR ("system" uses QApplication.beep()).
+SOUND_FILES = {
+    "soft_ding": "soft_ding.wav",
+    "short_chirp": "short_chirp.wav",
+    "alarm": "alarm.wav",
+}
+
+
+# ---------------------------------------------------------------------------
+# Styles
+# ---------------------------------------------------------------------------
+
+_DARK_SS = """
+QWidget { background-color: #222; color: #eee; }
+QGroupBox { border: 1px solid #444; margin-top: 6px; }
+QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 3px 0 3px; }
+QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QTextEdit, QTableView {
+    background-color: #333; color: #eee; border: 1px solid #555;
+}
+QHeaderView::section { background-color: #333; color: #eee; }
+QPushButton { background-color: #444; color: #eee; border: 1px solid #666; padding: 3px 8px; }
+QPushButton:disabled { background-color: #333; color: #777; }
+"""
+
+_LIGHT_SS = ""
+
+
+# ---------------------------------------------------------------------------
+# Band presets
+# ---------------------------------------------------------------------------
+
+# Preset name -> {target band: (start MHz, stop MHz)}; "default" covers any
+# band without its own entry.
+PRESETS: Dict[str, Dict[str, Tuple[float, float]]] = {
+    "VHF Ham": {"default": (144.0, 148.0)},
+    "UHF Ham + GMRS/FRS": {
+        "A": (420.0, 450.0),
+        "B": (462.0, 468.0),
+        "C": (420.0, 470.0),
+        "default": (420.0, 470.0),
+    },
+    "915 MHz ISM": {"default": (902.0, 928.0)},
+    "2.4 GHz ISM": {"default": (2400.0, 2483.5)},
+    "5.8 GHz ISM": {"default": (5725.0, 5875.0)},
+}
 
 
 # ---------------------------------------------------------------------------
 # Bias-T / antenna power control helper
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _find_tool(name: str) -> Optional[str]:
+    # PATH lookups are filesystem scans; tools don't move while we run.
+    return shutil.which(name)
+
+
 def set_bias_tee(enable: bool, log_fn, serial: Optional[str] = None) -> bool:
-    exe = shutil.which("hackrf_biast") or shutil.which("hackrf_biast.exe")
+    exe = _find_tool("hackrf_biast") or _find_tool("hackrf_biast.exe")
     if not exe:
         return False
 
@@ -28,9 +90,16 @@ def set_bias_tee(enable: bool, log_fn, serial: Optional[str] = None) -> bool:
         cmd += ["-d", str(serial)]
 
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=2)
+        # Only stderr is kept, for the failure message.
+        subprocess.run(
+            cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=2
+        )
         log_fn(f"Bias-T set to: {'ON' if enable else 'OFF'} (via hackrf_biast)")
         return True
+    except subprocess.CalledProcessError as e:
+        detail = (e.stderr or "").strip() or str(e)
+        log_fn(f"Bias-T command failed (hackrf_biast, exit {e.returncode}): {detail}")
+        return False
     except Exception as e:
         log_fn(f"Bias-T command failed (hackrf_biast): {e}")
         return False
@@ -40,7 +109,38 @@ def set_bias_tee(enable: bool, log_fn, serial: Optional[str] = None) -> bool:
 # HackRF device detection
 # ---------------------------------------------------------------------------
 
+# hackrf_info takes a while (and can block on USB), so its result is reused
+# for a few seconds: (monotonic timestamp, devices).
+DEVICE_LIST_TTL_S = 5.0
+_device_cache: Optional[Tuple[float, List[Dict[str, str]]]] = None
+
+# One pass over hackrf_info output: each "Found HackRF" line starts the next
+# device index, each "Serial number: ..." line names the current device.
+_HACKRF_INFO_RE = re.compile(
+    r"^[ \t]*(?:found hackrf|[^:\n]*serial[^:\n]*:[ \t]*(?P<serial>\S+))",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def cached_hackrf_devices() -> Optional[List[Dict[str, str]]]:
+    """Device list from a recent list_hackrf_devices() call, or None."""
+    cache = _device_cache
+    if cache is not None and time.monotonic() - cache[0] < DEVICE_LIST_TTL_S:
+        return cache[1]
+    return None
+
+
+def invalidate_device_cache() -> None:
+    global _device_cache
+    _device_cache = None
+
+
 def list_hackrf_devices() -> List[Dict[str, str]]:
+    global _device_cache
+    cached = cached_hackrf_devices()
+    if cached is not None:
+        return cached
+
     devices: List[Dict[str, str]] = []
     try:
         result = subprocess.run(
@@ -54,22 +154,135 @@ def list_hackrf_devices() -> List[Dict[str, str]]:
         return devices
 
     index = -1
-    for line in result.stdout.splitlines():
-        raw = line.strip()
-        low = raw.lower()
-
-        if low.startswith("found hackrf"):
+    for m in _HACKRF_INFO_RE.finditer(result.stdout):
+        serial = m.group("serial")
+        if serial is None:
             index += 1
+        else:
+            devices.append(
+                {"index": str(index), "serial": serial, "label": f"HackRF {index} – {serial}"}
+            )
 
-        if "serial" in low and ":" in raw:
-            _, val = raw.split(":", 1)
-            serial = val.strip()
-            if serial:
-                devices.append({"index": str(index), "serial": serial})
-
+    _device_cache = (time.monotonic(), devices)
     return devices
 
 
+class _DeviceListSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(list)
+
+
+class _DeviceListTask(QtCore.QRunnable):
+    """Runs list_hackrf_devices() on the global thread pool (it can block on USB)."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _DeviceListSignals()
+
+    def run(self):
+        self.signals.finished.emit(list_hackrf_devices())
+
+
+class _BiasTeeSignals(QtCore.QObject):
+    log = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal(bool, bool)  # enable, ok
+
+
+class _BiasTeeTask(QtCore.QRunnable):
+    """Runs set_bias_tee() off the GUI thread (hackrf_biast can take a while)."""
+
+    def __init__(self, enable: bool, serial: Optional[str], signals: _BiasTeeSignals):
+        super().__init__()
+        self.enable = enable
+        self.serial = serial
+        self.signals = signals
+
+    def run(self):
+        ok = set_bias_tee(self.enable, self.signals.log.emit, serial=self.serial)
+        self.signals.finished.emit(self.enable, ok)
+
+
+# ---------------------------------------------------------------------------
+# Worker settings snapshot
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class WorkerConfig:
+    """
+    Everything SweepWorker needs for a run. The GUI builds a new snapshot and
+    hands it over with one queued apply_config() call instead of writing
+    worker attributes one by one.
+    """
+    bands: Tuple[Dict[str, Any], ...] = ()
+    bin_width_hz: int = 250_000
+    threshold_db: float = 3.0
+    use_local_noise_floor: bool = True
+    only_above_threshold: bool = True
+    min_hold_time_s: float = 0.0
+    interval_ms: int = 0
+    device_arg: Optional[str] = None
+    antenna_power: bool = False
+    cal_gain_db: float = 0.0
+    cal_loss_db: float = 0.0
+    freq_ppm: float = 0.0
+    fast_noise_floor: bool = True
+
+    @property
+    def net_cal_offset_db(self) -> float:
+        return self.cal_gain_db - self.cal_loss_db
+
+    @property
+    def freq_factor(self) -> float:
+        return 1.0 + self.freq_ppm / 1e6
+
+
+# ---------------------------------------------------------------------------
+# Noise floor helpers
+# ---------------------------------------------------------------------------
+
+def median3(a: float, b: float, c: float) -> float:
+    """Median of three values by compare/swap only (no sort, no array)."""
+    return max(min(a, b), min(max(a, b), c))
+
+
+def _median_of_lowest(values: np.ndarray, k: int, inplace: bool = False) -> float:
+    """
+    Median of the k smallest values. One partition puts the two middle order
+    statistics in place, so they are read directly instead of partitioning
+    to k and then taking a separate median.
+    """
+    lo, hi = (k - 1) // 2, k // 2
+    if inplace:
+        values.partition((lo, hi))
+        part = values
+    else:
+        part = np.partition(values, (lo, hi))
+    return 0.5 * (float(part[lo]) + float(part[hi]))
+
+
+class _SlidingMedian:
+    """
+    Median of the last `size` values. A sorted copy of the window is kept
+    alongside it, so each push is a binary search + insert/delete instead of
+    re-sorting the whole window.
+    """
+
+    def __init__(self, size: int):
+        self._window: collections.deque = collections.deque(maxlen=size)
+        self._sorted: List[float] = []
+
+    def push(self, value: float) -> float:
+        if len(self._window) == self._window.maxlen:
+            del self._sorted[bisect.bisect_left(self._sorted, self._window[0])]
+        self._window.append(value)
+        bisect.insort(self._sorted, value)
+
+        n = len(self._sorted)
+        mid = n // 2
+        if n % 2:
+            return self._sorted[mid]
+        return 0.5 * (self._sorted[mid - 1] + self._sorted[mid])
+
+
 # ---------------------------------------------------------------------------
 # Sweep worker: noise floor + detection only (no spectrum/waterfall)
 # ---------------------------------------------------------------------------
@@ -77,74 +290,80 @@ def list_hackrf_devices() -> List[Dict[str, str]]:
 class SweepWorker(QtCore.QObject):
     log_message = QtCore.pyqtSignal(str)
     noise_floor_updated = QtCore.pyqtSignal(float)
-    detections_found = QtCore.pyqtSignal(list)
     finished = QtCore.pyqtSignal()
 
-    def __init__(
-        self,
-        bands: List[Dict[str, Any]],
-        bin_width_hz: int,
-        threshold_db: float,
-        use_local_noise_floor: bool,
-        only_above_threshold: bool,
-        min_hold_time_s: float,
-        interval_ms: int,
-        device_arg: Optional[str] = None,
-        antenna_power: bool = False,
-        cal_gain_db: float = 0.0,
-        cal_loss_db: float = 0.0,
-        freq_ppm: float = 0.0,
-        parent=None,
-    ):
+    # Noise floor tracking: a short median rejects one-frame transients, a
+    # long median over its output follows slow drift while ignoring
+    # emitters that sit in band for many frames.
+    NOISE_STAGE1_LEN = 3  # median3() below assumes three
+    NOISE_STAGE2_LEN = 64
+
+    # Worker -> GUI traffic: detections go into a buffer the GUI polls, and
+    # "Max:" lines are rate-limited per band, so a fast sweep can't flood the
+    # GUI event loop with queued signals.
+    DETECTION_BUFFER_LEN = 4096
+    MAX_LOG_INTERVAL_S = 0.5
+    NOISE_EMIT_MIN_DELTA_DB = 0.1
+    NOISE_EMIT_INTERVAL_S = 0.25
+
+    def __init__(self, parent=None, config: Optional[WorkerConfig] = None):
         super().__init__(parent)
-        self.bands = bands
-        self.bin_width_hz = bin_width_hz
-        self.threshold_db = float(threshold_db)
-        self.use_local_noise_floor = bool(use_local_noise_floor)
-        self.only_above_threshold = bool(only_above_threshold)
-        self.min_hold_time_s = float(min_hold_time_s)
-        self.interval_ms = int(interval_ms)
-        self.device_arg = device_arg
-
-        self.antenna_power = bool(antenna_power)
-        self.cal_gain_db = float(cal_gain_db)
-        self.cal_loss_db = float(cal_loss_db)
-        self.freq_ppm = float(freq_ppm)
-
-        self._running = True
+        self._running = False
+        self._rng = np.random.default_rng()
+        # Scratch buffers for the fast noise estimate, resized only when the
+        # frame's bin count changes: uniform draws, bin indices, samples.
+        self._noise_u = np.empty(0, dtype=np.float64)
+        self._noise_idx = np.empty(0, dtype=np.intp)
+        self._noise_buf = np.empty(0, dtype=np.float32)
+        self.config = config or WorkerConfig()
+        self._band_plan = self._build_band_plan(self.config)
+        # Filled here, drained by the GUI thread's poll timer. deque append
+        # and popleft are thread-safe; if the GUI stalls, the oldest
+        # detections are dropped rather than growing without bound.
+        self.detection_buffer: collections.deque = collections.deque(maxlen=self.DETECTION_BUFFER_LEN)
+        self._reset_state()
+
+    def _reset_state(self) -> None:
         self._noise_floor = None
-        self._hold_state: Dict[float, Dict[str, Any]] = {}
+        self._noise_stage1: collections.deque = collections.deque(maxlen=self.NOISE_STAGE1_LEN)
+        self._noise_stage2 = _SlidingMedian(self.NOISE_STAGE2_LEN)
+        # Per-segment hold state: (first_seen, above) arrays, one entry per
+        # bin. A band sweep yields several frames at different low_hz, so
+        # state is keyed by (band name, low_hz).
+        self._band_state: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = {}
+        # (low_hz, bin width, n_bins) -> (raw MHz, ppm-corrected MHz) bin
+        # centers. Segments repeat every sweep, so the axis is built once.
+        self._freq_axis_cache: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+        self._last_noise_emitted: Optional[float] = None
+        self._last_noise_emit = float("-inf")
+
+        # Per band: (power, MHz, band, time queued) of the strongest max held
+        # back by the log rate limit.
+        self._pending_max: Dict[str, Tuple[float, float, Dict[str, Any], float]] = {}
+        self._last_max_log: Dict[str, float] = {}
 
     @QtCore.pyqtSlot()
     def run(self):
+        self._reset_state()
         try:
             while self._running:
-                cycle_start = time.time()
-                any_band = False
+                cycle_start = time.monotonic()
+                band_plan = self._band_plan
+
+                for start_hz, stop_hz, extra_args, band in band_plan:
+                    # run() blocks this thread's event loop; let queued
+                    # setting updates from the GUI land between band sweeps.
+                    QtCore.QCoreApplication.processEvents()
 
-                for band in self.bands:
                     if not self._running:
                         break
-                    if not band.get("enabled"):
-                        continue
-
-                    any_band = True
-                    start_hz = band["start_hz"]
-                    stop_hz = band["stop_hz"]
 
                     try:
-                        extra_args = ["-1"]
-
-                        if self.device_arg:
-                            extra_args += ["-d", self.device_arg]
-
-                        if self.antenna_power:
-                            extra_args += ["-p", "1"]
-
                         for frame in iter_sweep_frames(
                             start_hz,
                             stop_hz,
-                            self.bin_width_hz,
+                            self.config.bin_width_hz,
                             extra_args=extra_args,
                         ):
                             if not self._running:
@@ -160,134 +379,339 @@ class SweepWorker(QtCore.QObject):
                 if not self._running:
                     break
 
-                if not any_band:
+                if not band_plan:
                     self.log_message.emit("No bands enabled; worker sleeping.")
                     time.sleep(1.0)
 
-                if self.interval_ms > 0:
-                    elapsed_ms = (time.time() - cycle_start) * 1000.0
-                    remaining = self.interval_ms - elapsed_ms
+                if self.config.interval_ms > 0:
+                    elapsed_ms = (time.monotonic() - cycle_start) * 1000.0
+                    remaining = self.config.interval_ms - elapsed_ms
                     if remaining > 0:
                         time.sleep(remaining / 1000.0)
         finally:
+            self._flush_pending_max()
             self.finished.emit()
 
+    @QtCore.pyqtSlot(object)
+    def apply_config(self, config: WorkerConfig):
+        """Swap in a new settings snapshot; takes effect from the next frame."""
+        if config.freq_ppm != self.config.freq_ppm:
+            self._freq_axis_cache.clear()
+        if (config.bands, config.device_arg, config.antenna_power) != (
+            self.config.bands,
+            self.config.device_arg,
+            self.config.antenna_power,
+        ):
+            self._band_plan = self._build_band_plan(config)
+        self.config = config
+
+    @staticmethod
+    def _build_band_plan(
+        config: WorkerConfig,
+    ) -> List[Tuple[float, float, Tuple[str, ...], Dict[str, Any]]]:
+        """(start_hz, stop_hz, hackrf_sweep extra args, band) per enabled band."""
+        extra_args = ["-1"]
+        if config.device_arg:
+            extra_args += ["-d", config.device_arg]
+        if config.antenna_power:
+            extra_args += ["-p", "1"]
+        extra = tuple(extra_args)
+        return [
+            (band["start_hz"], band["stop_hz"], extra, band)
+            for band in config.bands
+            if band.get("enabled")
+        ]
+
+    def arm(self):
+        # Called directly from the GUI thread before run() is queued, so a
+        # stop() that lands before run() starts is not overwritten.
+        self._running = True
+
     def stop(self):
         self._running = False
 
-    def _net_cal_offset_db(self) -> float:
-        return float(self.cal_gain_db) - float(self.cal_loss_db)
-
-    def _freq_factor(self) -> float:
-        return 1.0 + (float(self.freq_ppm) / 1e6)
+    def _segment_state(
+        self, band_name: str, low_hz: float, n_bins: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        key = (band_name, int(round(low_hz)))
+        state = self._band_state.get(key)
+        if state is None or state[1].size != n_bins:
+            # Only reallocated when the bin count changes (e.g. new bin width).
+            # NaN = never above threshold in this run.
+            state = (np.full(n_bins, np.nan), np.zeros(n_bins, dtype=bool))
+            self._band_state[key] = state
+        return state
+
+    def _freq_axis(self, low_hz: float, bin_w: float, n_bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        key = (int(round(low_hz)), int(round(bin_w)), n_bins)
+        axis = self._freq_axis_cache.get(key)
+        if axis is None:
+            centers_hz_raw = low_hz + (np.arange(n_bins) + 0.5) * bin_w
+            axis = (centers_hz_raw / 1e6, centers_hz_raw * self.config.freq_factor / 1e6)
+            self._freq_axis_cache[key] = axis
+        return axis
+
+    def _estimate_noise(self, powers: np.ndarray) -> float:
+        n = powers.size
+        if self.config.fast_noise_floor and n >= 40:
+            # The floor drifts slowly, so a random quarter of the bins gives an
+            # equivalent estimate on wide sweeps at a fraction of the cost.
+            m = n // 4
+            if self._noise_buf.size != m:
+                self._noise_u = np.empty(m, dtype=np.float64)
+                self._noise_idx = np.empty(m, dtype=np.intp)
+                self._noise_buf = np.empty(m, dtype=np.float32)
+            # Draw indices into the cached buffers: floor(u * n), clamped in
+            # case rounding lands on n.
+            u = self._rng.random(out=self._noise_u)
+            np.multiply(u, n, out=u)
+            idx = self._noise_idx
+            np.copyto(idx, u, casting="unsafe")
+            np.minimum(idx, n - 1, out=idx)
+            sample = np.take(powers, idx, out=self._noise_buf)
+            # The sample buffer is scratch space, so partition it in place.
+            return _median_of_lowest(sample, int(sample.size * 0.8), inplace=True)
+
+        # Only the lowest 80% matter (all bins on tiny frames).
+        return _median_of_lowest(powers, int(n * 0.8) if n > 10 else n)
 
     def _handle_frame(self, band: Dict[str, Any], frame: Dict[str, Any]) -> None:
-        powers_raw = frame["powers_dbm"]
-        if not powers_raw:
+        # Powers stay float32 from the backend through thresholding; values
+        # only become Python floats in the emitted detection dicts.
+        # Frequencies and times stay float64 (float32 can't hold a 6 GHz
+        # bin center to the Hz).
+        powers_raw = np.asarray(frame["powers_dbm"], dtype=np.float32)
+        if powers_raw.size == 0:
             return
 
-        cal_offset = self._net_cal_offset_db()
-        powers = [p + cal_offset for p in powers_raw]
+        # One snapshot per frame: a config swap can't land halfway through.
+        cfg = self.config
+        cal_offset = cfg.net_cal_offset_db
+        powers = powers_raw + np.float32(cal_offset)
 
-        sorted_p = sorted(powers)
-        if len(sorted_p) > 10:
-            cutoff = int(len(sorted_p) * 0.8)
-            noise_candidates = sorted_p[:cutoff]
-        else:
-            noise_candidates = sorted_p
-        median_noise = statistics.median(noise_candidates)
+        # Dwell bookkeeping runs on the monotonic clock so wall-clock jumps
+        # can't stretch or shrink a hold period.
+        now = time.monotonic()
 
-        if self._noise_floor is None:
-            self._noise_floor = median_noise
+        stage1 = self._noise_stage1
+        stage1.append(self._estimate_noise(powers))
+        if len(stage1) == 3:
+            stage1_median = median3(*stage1)
         else:
-            alpha = 0.1
-            self._noise_floor = (1 - alpha) * self._noise_floor + alpha * median_noise
+            # Warming up: the median of one or two values is their mean.
+            stage1_median = sum(stage1) / len(stage1)
+        self._noise_floor = self._noise_stage2.push(stage1_median)
+
+        # The GUI only needs to hear about visible changes (or a periodic
+        # refresh), not every frame.
+        if (
+            self._last_noise_emitted is None
+            or abs(self._noise_floor - self._last_noise_emitted) >= self.NOISE_EMIT_MIN_DELTA_DB
+            or now - self._last_noise_emit >= self.NOISE_EMIT_INTERVAL_S
+        ):
+            self._last_noise_emitted = self._noise_floor
+            self._last_noise_emit = now
+            self.noise_floor_updated.emit(self._noise_floor)
+
+        if cfg.use_local_noise_floor:
+            abs_threshold = self._noise_floor + cfg.threshold_db
+        else:
+            abs_threshold = cfg.threshold_db
 
-        self.noise_floor_updated.emit(self._noise_floor)
+        low_hz = float(frame["low_hz"])
+        n_bins = powers.size
+        freqs_mhz_raw, freqs_mhz = self._freq_axis(low_hz, float(frame["bin_width_hz"]), n_bins)
+
+        hold = cfg.min_hold_time_s
+
+        first_seen, above = self._segment_state(band.get("name", ""), low_hz, n_bins)
+        above_now = powers >= abs_threshold
+        # Everything below works on the (usually few) above-threshold bins
+        # rather than making more full passes over the frame.
+        above_idx = np.flatnonzero(above_now)
+
+        # Rising edges start a dwell; a bin that drops out simply stops being
+        # above, so there is nothing to expire or clean up afterwards.
+        first_seen[above_now & ~above] = now
+        above[:] = above_now
+
+        # Hold state is indexed by bin; frequencies are only materialized for
+        # the bins that actually produce a detection.
+        if hold > 0:
+            det_idx = above_idx[(now - first_seen[above_idx]) >= hold]
+        else:
+            det_idx = above_idx
+        detections: List[Dict[str, Any]] = []
+        if det_idx.size:
+            band_name = band.get("name", "")
+            freq_ppm = cfg.freq_ppm
+            wall_ts = time.time()
+            for freq_mhz, freq_mhz_raw, p_cal, p_raw in zip(
+                freqs_mhz[det_idx].tolist(),
+                freqs_mhz_raw[det_idx].tolist(),
+                powers[det_idx].tolist(),
+                powers_raw[det_idx].tolist(),
+            ):
+                detections.append(
+                    {
+                        "freq_mhz": freq_mhz,
+                        "freq_mhz_raw": freq_mhz_raw,
+                        "power_dbm": p_cal,
+                        "power_dbm_raw": p_raw,
+                        "cal_offset_db": cal_offset,
+                        "freq_ppm": freq_ppm,
+                        "timestamp": wall_ts,
+                        "band": band_name,
+                    }
+                )
 
-        if self.use_local_noise_floor:
-            abs_threshold = self._noise_floor + float(self.threshold_db)
+        # If anything is above threshold the frame max is among those bins.
+        # Otherwise it only matters when below-threshold maxima are logged.
+        if above_idx.size:
+            max_idx = int(above_idx[powers[above_idx].argmax()])
+        elif not cfg.only_above_threshold:
+            max_idx = int(powers.argmax())
         else:
-            abs_threshold = float(self.threshold_db)
+            max_idx = -1
+        if max_idx >= 0:
+            self._queue_max_line(band, float(powers[max_idx]), float(freqs_mhz[max_idx]), now)
 
-        low_hz = float(frame["low_hz"])
-        bin_w = float(frame["bin_width_hz"])
-        f_factor = self._freq_factor()
+        if detections:
+            self.detection_buffer.extend(detections)
+
+    def _queue_max_line(
+        self, band: Dict[str, Any], max_power: float, max_freq_mhz: float, now: float
+    ) -> None:
+        name = band.get("name", "")
+        pending = self._pending_max.get(name)
+        # A held-back peak only stands for the current log interval; with
+        # only-above-threshold logging the next line may come much later.
+        if pending is None or max_power > pending[0] or now - pending[3] > self.MAX_LOG_INTERVAL_S:
+            self._pending_max[name] = (max_power, max_freq_mhz, band, now)
+
+        if now - self._last_max_log.get(name, float("-inf")) < self.MAX_LOG_INTERVAL_S:
+            return
+        self._last_max_log[name] = now
+        self._emit_max_line(*self._pending_max.pop(name)[:3])
 
-        detections: List[Dict[str, Any]] = []
-        max_power = None
-        max_freq_mhz = None
-
-        now = time.time()
-        hold = float(self.min_hold_time_s)
-
-        n_bins = len(powers)
-        for idx in range(n_bins):
-            p_cal = powers[idx]
-            p_raw = powers_raw[idx]
-
-            center_hz_raw = low_hz + (idx + 0.5) * bin_w
-            center_hz = center_hz_raw * f_factor
-
-            freq_mhz_raw = center_hz_raw / 1e6
-            freq_mhz = center_hz / 1e6
-
-            key = round(freq_mhz, 6)
-            st = self._hold_state.get(key)
-
-            if p_cal >= abs_threshold:
-                if st is None or not st.get("above", False):
-                    st = {"first_seen": now, "last_seen": now, "above": True}
-                    self._hold_state[key] = st
-                else:
-                    st["last_seen"] = now
-                    st["above"] = True
-
-                dwell = 0.0 if st["first_seen"] is None else now - st["first_seen"]
-
-                if hold <= 0 or dwell >= hold:
-                    detections.append(
-                        {
-                            "freq_mhz": freq_mhz,
-                            "freq_mhz_raw": freq_mhz_raw,
-                            "power_dbm": p_cal,
-                            "power_dbm_raw": p_raw,
-                            "cal_offset_db": cal_offset,
-                            "freq_ppm": float(self.freq_ppm),
-                            "timestamp": now,
-                            "band": band.get("name", ""),
-                        }
-                    )
-            else:
-                if st is not None and st.get("above", False):
-                    st["above"] = False
-                    st["first_seen"] = None
-                    st["last_seen"] = now
-
-            if max_power is None or p_cal > max_power:
-                max_power = p_cal
-                max_freq_mhz = freq_mhz
-
-        cleanup_limit = max(hold * 2.0, 10.0)
-        stale_keys = []
-        for k, st in self._hold_state.items():
-            last_seen = st.get("last_seen")
-            if last_seen is not None and (now - last_seen) > cleanup_limit:
-                stale_keys.append(k)
-        for k in stale_keys:
-            del self._hold_state[k]
+    def _flush_pending_max(self) -> None:
+        """Log peaks still held back by the rate limit (end of a run)."""
+        for max_power, max_freq_mhz, band, _ in self._pending_max.values():
+            self._emit_max_line(max_power, max_freq_mhz, band)
+        self._pending_max.clear()
 
+    def _emit_max_line(self, max_power: float, max_freq_mhz: float, band: Dict[str, Any]) -> None:
         span_txt = f"{band['start_mhz']:.3f}-{band['stop_mhz']:.3f} MHz"
-        if max_power is not None and max_freq_mhz is not None:
-            line = f"Max: {max_power:.1f} dB at {max_freq_mhz:.6f} MHz (span {span_txt})"
-            if self.only_above_threshold:
-                if max_power >= abs_threshold:
-                    self.log_message.emit(line)
+        self.log_message.emit(f"Max: {max_power:.1f} dB at {max_freq_mhz:.6f} MHz (span {span_txt})")
+
+
+# ---------------------------------------------------------------------------
+# Detection table: a view model over the DetectionStore
+# ---------------------------------------------------------------------------
+
+class DetectionModel(QtCore.QAbstractTableModel):
+    """
+    Read-only table view of a DetectionStore, newest first. Cells are
+    formatted on demand, so a refresh costs one signal per range rather than
+    one item update per cell, and only visible rows are ever formatted.
+
+    Rows are a snapshot taken at refresh(): the store keeps merging between
+    refreshes, and a repaint in between must not mix the old `now` with
+    newer timestamps.
+    """
+
+    HEADERS = ("Frequency (MHz)", "Power (dB)", "Age (s)")
+
+    def __init__(self, store: DetectionStore, parent=None):
+        super().__init__(parent)
+        self._store = store
+        self._freqs_hz = np.empty(0, dtype=np.int64)
+        self._powers = np.empty(0, dtype=np.float32)
+        self._timestamps = np.empty(0, dtype=np.float64)
+        self._now = 0.0
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._freqs_hz.size
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if col == 0:
+            return f"{self._freqs_hz[row] / 1e6:.6f}"
+        if col == 1:
+            return f"{self._powers[row]:.1f}"
+        return f"{self._now - self._timestamps[row]:.1f}"
+
+    def _take(self, order: np.ndarray) -> None:
+        store = self._store
+        self._freqs_hz = store.freqs_hz[order]
+        self._powers = store.powers[order]
+        self._timestamps = store.timestamps[order]
+
+    def refresh(self, now: float, reorder: bool) -> None:
+        """Move ages to `now`; with `reorder`, re-snapshot rows from the store."""
+        self._now = now
+        if reorder:
+            order = self._store.newest_first()
+            old_n, new_n = self._freqs_hz.size, order.size
+            # Rows are positional: only the tail is inserted or removed, the
+            # rest are repainted in place.
+            if new_n > old_n:
+                self.beginInsertRows(QtCore.QModelIndex(), old_n, new_n - 1)
+                self._take(order)
+                self.endInsertRows()
+            elif new_n < old_n:
+                self.beginRemoveRows(QtCore.QModelIndex(), new_n, old_n - 1)
+                self._take(order)
+                self.endRemoveRows()
             else:
-                self.log_message.emit(line)
+                self._take(order)
+            first_col = 0
+        else:
+            first_col = 2
 
-        if detections:
-            self.detections_found.emit(detections)
+        n = self._freqs_hz.size
+        if n:
+            self.dataChanged.emit(
+                self.index(0, first_col), self.index(n - 1, 2), [QtCore.Qt.DisplayRole]
+            )
+
+
+# ---------------------------------------------------------------------------
+# ATAK send task: CoT sends run on a small pool, off the GUI thread
+# ---------------------------------------------------------------------------
+
+class _CotSignals(QtCore.QObject):
+    error = QtCore.pyqtSignal(str)
+    done = QtCore.pyqtSignal()
+
+
+class _CotTask(QtCore.QRunnable):
+    def __init__(self, bridge: AtakBridge, detections: List[Dict[str, Any]],
+                 noise_floor: Optional[float], signals: _CotSignals):
+        super().__init__()
+        self.bridge = bridge
+        self.detections = detections
+        self.noise_floor = noise_floor
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.bridge.send_detections_batch(self.detections, noise_floor=self.noise_floor)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.done.emit()
 
 
 # ---------------------------------------------------------------------------
@@ -295,6 +719,12 @@ class SweepWorker(QtCore.QObject):
 # ---------------------------------------------------------------------------
 
 class MainWindow(QtWidgets.QMainWindow):
+    COT_MAX_IN_FLIGHT = 8
+    COT_BACKLOG_MAX = 1024
+    ALARM_MIN_INTERVAL_S = 0.5
+    DETECTION_MAX_AGE_S = 300.0
+    LOG_MAX_LINES = 5000
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("HackRF Watchdog")
@@ -303,23 +733,78 @@ class MainWindow(QtWidgets.QMainWindow):
         self.atak_bridge = AtakBridge(self)
         self.atak_window = AtakBridgeWindow(self.atak_bridge, parent=self)
         self.atak_window.show()
-        self.atak_bridge.status_changed.connect(lambda s: self.append_log(f"ATAK: {s}"))
-
-        self.worker_thread: Optional[QtCore.QThread] = None
-        self.worker: Optional[SweepWorker] = None
+        self.atak_bridge.status_changed.connect(self._on_atak_status)
+
+        # CoT sends go through a bounded pool. While too many batches are in
+        # flight, new detections are coalesced per frequency (latest wins).
+        self._cot_pool = QtCore.QThreadPool(self)
+        self._cot_pool.setMaxThreadCount(2)
+        self._cot_signals = _CotSignals(self)
+        self._cot_signals.error.connect(self._on_cot_error)
+        self._cot_signals.done.connect(self.on_cot_batch_done)
+        self._cot_in_flight = 0
+        self._cot_backlog: Dict[int, Dict[str, Any]] = {}
+        self._cot_dropped = 0
+
+        # Bias-T toggles run one at a time, in order, so an "off" never
+        # overtakes the "on" it undoes.
+        self._bias_pool = QtCore.QThreadPool(self)
+        self._bias_pool.setMaxThreadCount(1)
+        self._bias_signals = _BiasTeeSignals(self)
+        self._bias_signals.log.connect(self.append_log)
+        self._bias_signals.finished.connect(self._on_bias_tee_done)
+        self._run_pending = False
+
+        # One long-lived worker/thread pair; each start only queues an
+        # apply_config() and a run() on it.
+        self.worker_thread = QtCore.QThread(self)
+        self.worker = SweepWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.log_message.connect(self.append_log)
+        self.worker.noise_floor_updated.connect(self.on_noise_floor_updated)
+        self.worker_thread.start()
+        self._sweeping: bool = False
+        self._stopping: bool = False
 
-        self.detections: Dict[float, Dict[str, Any]] = {}
+        self.detections = DetectionStore()
+        self.detection_model = DetectionModel(self.detections, self)
+        self._detections_dirty = False
         self.current_noise_floor: Optional[float] = None
+        self._noise_label_pending = False
+        # Noise floor the labels currently show.
+        self._shown_noise_floor: Optional[float] = None
         self.sound_effects: Dict[str, QSoundEffect] = {}
 
         self.current_bin_width: int = 250_000
 
         self.bias_tee_requested: bool = False
         self.bias_tee_engaged: bool = False
+        # Device the running sweep was started on; bias-T teardown targets it
+        # even if the combo changed since.
+        self._active_device_arg: Optional[str] = None
+        self._debug_dirty: bool = False
+        self._dark_active: bool = False
+        # Last settings snapshot handed to the worker.
+        self._last_sent: Optional[WorkerConfig] = None
+
+        self._beep_enabled: bool = False
+        self._beep_mode: Optional[str] = "system"
+        self._last_alarm = 0.0
+
+        self._devlist_task: Optional[_DeviceListTask] = None
 
         self._build_ui()
         self._create_timers()
-        self.refresh_device_list()
+        self._load_sound_effects()
+
+        # If a serial was used last time, offer it straight away and leave the
+        # (slow) hackrf_info enumeration to the Refresh button.
+        last_serial = QtCore.QSettings().value("device/last_serial", "", type=str)
+        if last_serial:
+            self._populate_device_combo([], remembered_serial=last_serial)
+        else:
+            self.refresh_device_list()
 
     def _build_ui(self):
         central = QtWidgets.QWidget()
@@ -370,7 +855,15 @@ class MainWindow(QtWidgets.QMainWindow):
         row += 1
         self.use_noise_floor_cb = QtWidgets.QCheckBox("Use local noise floor")
         self.use_noise_floor_cb.setChecked(True)
-        det_layout.addWidget(self.use_noise_floor_cb, row, 0, 1, 2)
+        det_layout.addWidget(self.use_noise_floor_cb, row, 0)
+
+        self.fast_noise_floor_cb = QtWidgets.QCheckBox("Fast noise floor")
+        self.fast_noise_floor_cb.setChecked(True)
+        self.fast_noise_floor_cb.setToolTip(
+            "Estimate the noise floor from a random subsample of bins.\n"
+            "Much cheaper on wide sweeps; disable for an exact per-frame estimate."
+        )
+        det_layout.addWidget(self.fast_noise_floor_cb, row, 1)
 
         self.noise_floor_label = QtWidgets.QLabel("Noise floor: --.- dB")
         det_layout.addWidget(self.noise_floor_label, row, 2, 1, 2)
@@ -550,13 +1043,32 @@ class MainWindow(QtWidgets.QMainWindow):
         self.max_bins_spin.setValue(400)
         bg_layout.addWidget(self.max_bins_spin, row, 3)
 
+        row += 1
+        bg_layout.addWidget(QtWidgets.QLabel("Preset"), row, 0)
+        self.preset_combo = QtWidgets.QComboBox()
+        self.preset_combo.addItems(list(PRESETS))
+        bg_layout.addWidget(self.preset_combo, row, 1)
+        self.preset_target_combo = QtWidgets.QComboBox()
+        self.preset_target_combo.addItems(["A", "B", "C"])
+        bg_layout.addWidget(self.preset_target_combo, row, 2)
+        self.apply_preset_btn = QtWidgets.QPushButton("Apply preset")
+        bg_layout.addWidget(self.apply_preset_btn, row, 3)
+
         main_layout.addWidget(band_group)
 
+        # Built once; everything that walks the bands reuses this list.
+        self._band_widgets = [
+            ("A", self.bandA_enable, self.bandA_start, self.bandA_stop),
+            ("B", self.bandB_enable, self.bandB_start, self.bandB_stop),
+            ("C", self.bandC_enable, self.bandC_start, self.bandC_stop),
+        ]
+        self._bands = {name: widgets for name, *widgets in self._band_widgets}
+
         # ---------------- Bottom splitter ----------------
         bottom_splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical)
 
-        self.table = QtWidgets.QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["Frequency (MHz)", "Power (dB)", "Age (s)"])
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.detection_model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -567,11 +1079,25 @@ class MainWindow(QtWidgets.QMainWindow):
         font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
         font.setPointSize(14)
         self.log_edit.setFont(font)
+        # Roll off the oldest lines instead of growing the document forever.
+        self.log_edit.document().setMaximumBlockCount(self.LOG_MAX_LINES)
+
+        # Debug / status panel; unchecking the group collapses it
+        self.debug_group = QtWidgets.QGroupBox("Debug / status")
+        self.debug_group.setCheckable(True)
+        self.debug_group.setChecked(True)
+        debug_layout = QtWidgets.QVBoxLayout(self.debug_group)
+        self.debug_label = QtWidgets.QLabel("")
+        self.debug_label.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
+        self.debug_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        debug_layout.addWidget(self.debug_label)
 
         bottom_splitter.addWidget(self.table)
         bottom_splitter.addWidget(self.log_edit)
+        bottom_splitter.addWidget(self.debug_group)
         bottom_splitter.setStretchFactor(0, 3)
         bottom_splitter.setStretchFactor(1, 1)
+        bottom_splitter.setStretchFactor(2, 0)
 
         main_layout.addWidget(bottom_splitter, 1)
 
@@ -580,8 +1106,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_btn.clicked.connect(self.stop_watchdog)
         self.dark_mode_checkbox.toggled.connect(self.apply_dark_mode)
         self.clear_log_btn.clicked.connect(self.clear_log)
+        self.beep_checkbox.toggled.connect(self.on_beep_toggled)
+        self.beep_sound_combo.currentIndexChanged.connect(self.on_beep_sound_changed)
         self.refresh_devices_btn.clicked.connect(self.refresh_device_list)
         self.use_noise_floor_cb.toggled.connect(self.on_use_noise_floor_toggled)
+        self.fast_noise_floor_cb.toggled.connect(self.on_fast_noise_floor_toggled)
         self.threshold_spin.valueChanged.connect(self.on_threshold_changed)
         self.auto_bin_checkbox.toggled.connect(self.on_auto_bin_toggled)
 
@@ -590,11 +1119,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ppm_spin.valueChanged.connect(self.on_ppm_changed)
 
         self.atak_btn.clicked.connect(self.show_atak_bridge)
+        self.apply_preset_btn.clicked.connect(self.on_apply_preset)
+
+        self.debug_group.toggled.connect(self.debug_label.setVisible)
+        self.debug_group.toggled.connect(self.update_debug_info)
+        for _, enabled_cb, start_spin, stop_spin in self._band_widgets:
+            for sig in (enabled_cb.toggled, start_spin.valueChanged, stop_spin.valueChanged):
+                sig.connect(self._update_band_caches)
+                sig.connect(self.update_debug_info)
+        self._update_band_caches()
+        self.bin_width_spin.valueChanged.connect(self.update_debug_info)
+        self.max_bins_spin.valueChanged.connect(self.update_debug_info)
+        self.interval_spin.valueChanged.connect(self.update_debug_info)
+        self.bias_tee_checkbox.toggled.connect(self.update_debug_info)
 
         self.on_auto_bin_toggled(self.auto_bin_checkbox.isChecked())
         self.on_use_noise_floor_toggled(self.use_noise_floor_cb.isChecked())
         self.on_cal_changed()
         self.update_effective_threshold_label()
+        self.update_debug_info()
 
     def show_atak_bridge(self):
         self.atak_window.show()
@@ -602,42 +1145,141 @@ class MainWindow(QtWidgets.QMainWindow):
         self.atak_window.activateWindow()
 
     def _create_timers(self):
+        # Table refresh is event-driven: new detections arm this single-shot
+        # timer, so bursts within the window collapse into one repaint.
         self.update_timer = QtCore.QTimer(self)
-        self.update_timer.setInterval(500)
+        self.update_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.update_timer.setInterval(1000)
+        self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.refresh_detection_table)
-        self.update_timer.start()
 
+        # Slow tick so ages keep moving while nothing new arrives.
+        self.age_timer = QtCore.QTimer(self)
+        self.age_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.age_timer.setInterval(2000)
+        self.age_timer.timeout.connect(self.refresh_detection_table)
+        self.age_timer.start()
+
+        # Log lines are queued as (format, args) and written in one append per
+        # flush, so a burst of worker messages costs one text layout pass
+        # instead of N, and lines evicted from the queue are never formatted.
+        self._log_queue: collections.deque = collections.deque(maxlen=self.LOG_MAX_LINES)
+        self.log_timer = QtCore.QTimer(self)
+        self.log_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.log_timer.setInterval(250)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.timeout.connect(self._flush_log)
+
+        # Drains the worker's detection buffer while sweeping.
+        self.detection_poll_timer = QtCore.QTimer(self)
+        self.detection_poll_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.detection_poll_timer.setInterval(200)
+        self.detection_poll_timer.timeout.connect(self._drain_detections)
+
+        self.worker_sync_timer = QtCore.QTimer(self)
+        self.worker_sync_timer.setTimerType(QtCore.Qt.CoarseTimer)
+        self.worker_sync_timer.setInterval(150)
+        self.worker_sync_timer.setSingleShot(True)
+        self.worker_sync_timer.timeout.connect(self._push_worker_settings)
+
+    @QtCore.pyqtSlot()
     def refresh_device_list(self):
+        cached = cached_hackrf_devices()
+        if cached is not None:
+            self._populate_device_combo(cached)
+            return
+
+        if self._devlist_task is not None:
+            return
+
+        self.refresh_devices_btn.setEnabled(False)
+        self._devlist_task = _DeviceListTask()
+        self._devlist_task.signals.finished.connect(self.on_device_list_ready)
+        QtCore.QThreadPool.globalInstance().start(self._devlist_task)
+
+    @QtCore.pyqtSlot(list)
+    def on_device_list_ready(self, devices: List[Dict[str, str]]):
+        self._devlist_task = None
+        self.refresh_devices_btn.setEnabled(True)
+        self._populate_device_combo(devices)
+
+    def _populate_device_combo(
+        self, devices: List[Dict[str, str]], remembered_serial: str = ""
+    ):
+        selected = self.device_combo.currentData() or remembered_serial
+
         self.device_combo.clear()
         self.device_combo.addItem("Default (first HackRF)", userData=None)
-        devices = list_hackrf_devices()
         for dev in devices:
-            label = f"HackRF {dev['index']} – {dev['serial']}"
-            self.device_combo.addItem(label, userData=dev["serial"])
+            self.device_combo.addItem(dev["label"], userData=dev["serial"])
+
+        if remembered_serial and self.device_combo.findData(remembered_serial) < 0:
+            self.device_combo.addItem(f"HackRF – {remembered_serial} (last used)", userData=remembered_serial)
+
+        if selected:
+            idx = self.device_combo.findData(selected)
+            if idx >= 0:
+                self.device_combo.setCurrentIndex(idx)
 
     def net_cal_offset_db(self) -> float:
         return float(self.cal_gain_spin.value()) - float(self.cal_loss_spin.value())
 
+    def _live_config(self, base: WorkerConfig) -> WorkerConfig:
+        # Settings that may change while sweeping; the rest stay as started.
+        return replace(
+            base,
+            threshold_db=float(self.threshold_spin.value()),
+            use_local_noise_floor=self.use_noise_floor_cb.isChecked(),
+            fast_noise_floor=self.fast_noise_floor_cb.isChecked(),
+            cal_gain_db=float(self.cal_gain_spin.value()),
+            cal_loss_db=float(self.cal_loss_spin.value()),
+            freq_ppm=float(self.ppm_spin.value()),
+        )
+
+    def _schedule_worker_sync(self):
+        # Debounced: a spin box drag pushes at most one update per interval.
+        if self._sweeping and not self.worker_sync_timer.isActive():
+            self.worker_sync_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _push_worker_settings(self):
+        if not self._sweeping or self._last_sent is None:
+            return
+        cfg = self._live_config(self._last_sent)
+        if cfg != self._last_sent:
+            self._send_worker_config(cfg)
+
+    def _send_worker_config(self, cfg: WorkerConfig):
+        self._last_sent = cfg
+        QtCore.QMetaObject.invokeMethod(
+            self.worker, "apply_config", QtCore.Qt.QueuedConnection, QtCore.Q_ARG(object, cfg)
+        )
+
+    @QtCore.pyqtSlot()
     def on_cal_changed(self):
         net = self.net_cal_offset_db()
         self.cal_net_label.setText(f"Net power offset: {net:+.1f} dB (gain − loss)")
-        if self.worker is not None:
-            self.worker.cal_gain_db = float(self.cal_gain_spin.value())
-            self.worker.cal_loss_db = float(self.cal_loss_spin.value())
+        self._schedule_worker_sync()
         self.update_effective_threshold_label()
+        self.update_debug_info()
 
+    @QtCore.pyqtSlot(float)
     def on_ppm_changed(self, value: float):
-        if self.worker is not None:
-            self.worker.freq_ppm = float(value)
+        self._schedule_worker_sync()
+        self.update_debug_info()
 
+    @QtCore.pyqtSlot(bool)
     def on_use_noise_floor_toggled(self, checked: bool):
-        if self.worker is not None:
-            self.worker.use_local_noise_floor = checked
+        self._schedule_worker_sync()
         self.update_effective_threshold_label()
 
+    @QtCore.pyqtSlot(bool)
+    def on_fast_noise_floor_toggled(self, checked: bool):
+        self._schedule_worker_sync()
+
+    @QtCore.pyqtSlot(float)
     def on_threshold_changed(self, value: float):
-        if self.worker is not None:
-            self.worker.threshold_db = float(value)
+        self._schedule_worker_sync()
         self.update_effective_threshold_label()
 
     def update_effective_threshold_label(self):
@@ -659,70 +1301,144 @@ class MainWindow(QtWidgets.QMainWindow):
                 f"Effective threshold: {thr:.1f} dB (absolute; cal {net:+.1f} applied)"
             )
 
+    @QtCore.pyqtSlot(bool)
     def on_auto_bin_toggled(self, checked: bool):
         self.bin_width_spin.setEnabled(not checked)
         self.max_bins_spin.setEnabled(checked)
+        self.update_debug_info()
+
+    def update_debug_info(self, *_):
+        # Coalesce bursts (spin box drags, several signals per action) into a
+        # single label update.
+        if self._debug_dirty:
+            return
+        self._debug_dirty = True
+        QtCore.QTimer.singleShot(150, QtCore.Qt.CoarseTimer, self._flush_debug_info)
+
+    def _flush_debug_info(self):
+        self._debug_dirty = False
+        if not self.debug_label.isVisibleTo(self):
+            return
+
+        running = self._sweeping
+        if running:
+            bin_txt = f"{self.current_bin_width} Hz"
+        elif self.auto_bin_checkbox.isChecked():
+            bin_txt = f"auto (max {self.max_bins_spin.value()} bins)"
+        else:
+            bin_txt = f"{self.bin_width_spin.value()} Hz"
 
-    def choose_auto_bin_width(self, bands: List[Dict[str, Any]]) -> int:
+        if self.bias_tee_engaged:
+            bias_txt = "ON"
+        elif self.bias_tee_requested:
+            bias_txt = "requested (sweep -p 1 only)"
+        else:
+            bias_txt = "OFF"
+
+        lines = [
+            f"State: {'RUNNING' if running else 'Idle'}",
+            f"Bin width: {bin_txt}",
+            f"Interval: {self.interval_spin.value()} ms",
+            f"Bias-T: {bias_txt}",
+            f"Cal offset: {self.net_cal_offset_db():+.1f} dB, ppm: {self.ppm_spin.value():+.1f}",
+        ]
+        for (name, *_), (enabled, start_mhz, stop_mhz) in zip(self._band_widgets, self._band_values):
+            if not enabled:
+                status = "off"
+            elif stop_mhz <= start_mhz:
+                status = "invalid range"
+            else:
+                status = "on"
+            lines.append(f"Band {name}: {status} ({start_mhz:.3f}-{stop_mhz:.3f} MHz)")
+
+        self.debug_label.setText("\n".join(lines))
+
+    def _update_band_caches(self, *_):
+        # Read the band widgets once per change; readers use the caches.
+        self._band_values = [
+            (enabled_cb.isChecked(), start_spin.value(), stop_spin.value())
+            for _, enabled_cb, start_spin, stop_spin in self._band_widgets
+        ]
+        self._enabled_bands_cache = [
+            (start_mhz * 1e6, stop_mhz * 1e6, (stop_mhz - start_mhz) * 1e6)
+            for enabled, start_mhz, stop_mhz in self._band_values
+            if enabled and stop_mhz > start_mhz
+        ]
+
+    def choose_auto_bin_width(self) -> int:
         max_bins = self.max_bins_spin.value() or 400
-        max_span_hz = 0.0
-        for b in bands:
-            if not b.get("enabled", True):
-                continue
-            span_hz = (b["stop_mhz"] - b["start_mhz"]) * 1e6
-            max_span_hz = max(max_span_hz, span_hz)
+        max_span_hz = max((b[2] for b in self._enabled_bands_cache), default=0.0)
 
         if max_span_hz <= 0:
             return int(self.bin_width_spin.value()) or 250_000
 
-        raw_bin = max_span_hz / float(max_bins)
-        raw_bin = max(10_000, min(1_000_000, raw_bin))
-        nice = int(round(raw_bin / 10_000.0)) * 10_000
-        return nice if nice > 0 else 10_000
+        # Round to the nearest 10 kHz, then clamp to 10 kHz .. 1 MHz.
+        raw_bin = int(max_span_hz / max_bins)
+        nice = ((raw_bin + 5_000) // 10_000) * 10_000
+        return max(10_000, min(1_000_000, nice))
+
+    def _load_sound_effects(self):
+        # Decode the alarm WAVs up front; setSource() is synchronous and would
+        # otherwise stall the GUI on the first alarm of each kind.
+        sound_paths = {
+            mode: os.path.join(SOUNDS_DIR, fname)
+            for mode, fname in SOUND_FILES.items()
+            if os.path.exists(os.path.join(SOUNDS_DIR, fname))
+        }
+        for mode, sound_path in sound_paths.items():
+            effect = QSoundEffect(self)
+            effect.setSource(QtCore.QUrl.fromLocalFile(sound_path))
+            effect.setVolume(0.9)
+            self.sound_effects[mode] = effect
 
-    def play_alarm_sound(self):
-        if not self.beep_checkbox.isChecked():
-            return
+    @QtCore.pyqtSlot()
+    def on_apply_preset(self):
+        preset = PRESETS[self.preset_combo.currentText()]
+        target = self.preset_target_combo.currentText()
+        start_mhz, stop_mhz = preset.get(target, preset["default"])
+
+        enabled_cb, start_spin, stop_spin = self._bands[target]
+        start_spin.setValue(start_mhz)
+        stop_spin.setValue(stop_mhz)
+        enabled_cb.setChecked(True)
+        self.append_log(
+            f"Preset '{self.preset_combo.currentText()}' -> Band {target}: "
+            f"{start_mhz:.3f}-{stop_mhz:.3f} MHz"
+        )
 
-        mode = self.beep_sound_combo.currentData()
-        if mode == "system" or mode is None:
-            QtWidgets.QApplication.beep()
-            return
+    @QtCore.pyqtSlot(bool)
+    def on_beep_toggled(self, checked: bool):
+        self._beep_enabled = checked
 
-        filename_map = {
-            "soft_ding": "soft_ding.wav",
-            "short_chirp": "short_chirp.wav",
-            "alarm": "alarm.wav",
-        }
-        fname = filename_map.get(mode)
-        if not fname:
-            QtWidgets.QApplication.beep()
+    @QtCore.pyqtSlot(int)
+    def on_beep_sound_changed(self, _index: int):
+        self._beep_mode = self.beep_sound_combo.currentData()
+
+    def play_alarm_sound(self):
+        if not self._beep_enabled:
             return
 
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        sound_path = os.path.join(base_dir, "sounds", fname)
-        if not os.path.exists(sound_path):
-            QtWidgets.QApplication.beep()
+        # Detections arrive several times a second while a signal is up; one
+        # alarm per interval is enough and avoids restarting the effect.
+        now = time.monotonic()
+        if now - self._last_alarm < self.ALARM_MIN_INTERVAL_S:
             return
+        self._last_alarm = now
 
-        effect = self.sound_effects.get(mode)
+        # "system" (and any missing WAV) falls back to the system beep.
+        effect = self.sound_effects.get(self._beep_mode)
         if effect is None:
-            effect = QSoundEffect(self)
-            effect.setSource(QtCore.QUrl.fromLocalFile(sound_path))
-            effect.setVolume(0.9)
-            self.sound_effects[mode] = effect
+            QtWidgets.QApplication.beep()
+            return
         effect.play()
 
+    @QtCore.pyqtSlot()
     def start_watchdog(self):
-        if self.worker is not None:
+        if self._sweeping:
             return
 
         bands = []
-        for name, enabled_cb, start_spin, stop_spin in [
-            ("A", self.bandA_enable, self.bandA_start, self.bandA_stop),
-            ("B", self.bandB_enable, self.bandB_start, self.bandB_stop),
-            ("C", self.bandC_enable, self.bandC_start, self.bandC_stop),
-        ]:
+        for name, enabled_cb, start_spin, stop_spin in self._band_widgets:
             if not enabled_cb.isChecked():
                 continue
             start_mhz = start_spin.value()
@@ -745,155 +1461,278 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         if self.auto_bin_checkbox.isChecked():
-            bin_width = int(self.choose_auto_bin_width(bands))
+            bin_width = self.choose_auto_bin_width()
             self.append_log(f"Auto bin width selected: {bin_width} Hz")
         else:
             bin_width = int(self.bin_width_spin.value())
 
         self.current_bin_width = bin_width
 
-        threshold_db = float(self.threshold_spin.value())
-        use_noise_floor = self.use_noise_floor_cb.isChecked()
         only_above = self.only_above_threshold_cb.isChecked()
         interval_ms = int(self.interval_spin.value())
         min_hold = float(self.persistence_spin.value())
         device_arg = self.device_combo.currentData()
+        self._active_device_arg = device_arg
+        QtCore.QSettings().setValue("device/last_serial", device_arg or "")
 
         antenna_power = self.bias_tee_checkbox.isChecked()
-        cal_gain = float(self.cal_gain_spin.value())
-        cal_loss = float(self.cal_loss_spin.value())
-        ppm = float(self.ppm_spin.value())
 
         self.detections.clear()
+        self._detections_dirty = True
+        self.update_timer.start()
         self.status_label.setText("Sweeping...")
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
         self.bias_tee_requested = bool(antenna_power)
         self.bias_tee_engaged = False
-        if antenna_power:
-            self.bias_tee_engaged = set_bias_tee(True, self.append_log, serial=device_arg)
 
-        self.worker_thread = QtCore.QThread(self)
-        self.worker = SweepWorker(
-            bands=bands,
-            bin_width_hz=bin_width,
-            threshold_db=threshold_db,
-            use_local_noise_floor=use_noise_floor,
-            only_above_threshold=only_above,
-            min_hold_time_s=min_hold,
-            interval_ms=interval_ms,
-            device_arg=device_arg,
-            antenna_power=antenna_power,
-            cal_gain_db=cal_gain,
-            cal_loss_db=cal_loss,
-            freq_ppm=ppm,
+        cfg = self._live_config(
+            WorkerConfig(
+                bands=tuple(bands),
+                bin_width_hz=bin_width,
+                only_above_threshold=only_above,
+                min_hold_time_s=min_hold,
+                interval_ms=interval_ms,
+                device_arg=device_arg,
+                antenna_power=antenna_power,
+            )
         )
-        self.worker.moveToThread(self.worker_thread)
-
-        self.worker_thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.on_worker_finished)
-        self.worker.finished.connect(self.worker_thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-
-        self.worker.log_message.connect(self.append_log)
-        self.worker.noise_floor_updated.connect(self.on_noise_floor_updated)
-        self.worker.detections_found.connect(self.on_detections_found)
-
-        self.worker_thread.start()
+        self._sweeping = True
+        self._stopping = False
+        self.worker.arm()
+        self.detection_poll_timer.start()
+        self._send_worker_config(cfg)
+        if antenna_power:
+            # hackrf_sweep would find the device busy while hackrf_biast runs,
+            # so the sweep starts from _on_bias_tee_done().
+            self._run_pending = True
+            self._start_bias_tee(True, device_arg)
+        else:
+            QtCore.QMetaObject.invokeMethod(self.worker, "run", QtCore.Qt.QueuedConnection)
         self.append_log("Starting watchdog...")
+        self.update_debug_info()
 
+    @QtCore.pyqtSlot()
     def stop_watchdog(self):
-        if self.worker is not None:
+        bias_on = self.bias_tee_requested or self.bias_tee_engaged
+        if (not self._sweeping or self._stopping) and not bias_on:
+            return
+
+        if self._sweeping and not self._stopping:
+            self._stopping = True
             self.append_log("Stopping watchdog...")
             self.status_label.setText("Stopping...")
             self.worker.stop()
 
-        if self.bias_tee_requested:
-            device_arg = self.device_combo.currentData()
-            set_bias_tee(False, self.append_log, serial=device_arg)
-            self.bias_tee_engaged = False
-            self.bias_tee_requested = False
+        self._release_bias_tee()
 
-        if self.worker is None:
+        if not self._sweeping:
             self.status_label.setText("Idle")
+        self.update_debug_info()
 
+    @QtCore.pyqtSlot()
     def on_worker_finished(self):
+        self.detection_poll_timer.stop()
+        self._drain_detections()
         self.append_log("Worker finished.")
 
-        if self.bias_tee_requested or self.bias_tee_engaged:
-            device_arg = self.device_combo.currentData()
-            set_bias_tee(False, self.append_log, serial=device_arg)
-            self.bias_tee_requested = False
-            self.bias_tee_engaged = False
+        # Pick up hot-plugged devices on the next Refresh.
+        invalidate_device_cache()
+
+        self._release_bias_tee()
 
         self.status_label.setText("Idle")
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
-        self.worker = None
-        self.worker_thread = None
+        self._sweeping = False
+        self._stopping = False
+        self._active_device_arg = None
+        self.update_debug_info()
+
+    def _release_bias_tee(self):
+        # Flags are cleared before the "off" is queued, so whichever of
+        # stop_watchdog()/on_worker_finished()/closeEvent() runs second finds
+        # nothing left to do.
+        if not (self.bias_tee_requested or self.bias_tee_engaged):
+            return
+        self.bias_tee_requested = False
+        self.bias_tee_engaged = False
+        self._start_bias_tee(False, self._active_device_arg)
+
+    def _start_bias_tee(self, enable: bool, serial: Optional[str]):
+        self._bias_pool.start(_BiasTeeTask(enable, serial, self._bias_signals))
+
+    @QtCore.pyqtSlot(bool, bool)
+    def _on_bias_tee_done(self, enable: bool, ok: bool):
+        # A stop may have cancelled the request while "on" was in flight.
+        if enable and self.bias_tee_requested:
+            self.bias_tee_engaged = ok
+        if enable and self._run_pending:
+            self._run_pending = False
+            # Queued even after a stop: run() then returns at once and its
+            # finished signal resets the UI.
+            QtCore.QMetaObject.invokeMethod(self.worker, "run", QtCore.Qt.QueuedConnection)
+        self.update_debug_info()
+
+    def closeEvent(self, event):
+        # Late worker signals must not reach widgets that are going away.
+        try:
+            self.worker.finished.disconnect(self.on_worker_finished)
+            self.worker.log_message.disconnect(self.append_log)
+            self.worker.noise_floor_updated.disconnect(self.on_noise_floor_updated)
+        except TypeError:
+            pass  # already disconnected by an earlier close
+        for timer in (self.detection_poll_timer, self.update_timer, self.age_timer, self.worker_sync_timer):
+            timer.stop()
+
+        # The worker thread lives as long as the window.
+        self.worker.stop()
+        self.worker_thread.quit()
+        self.worker_thread.wait(2000)
+
+        # on_worker_finished() no longer runs, so release the bias-T here.
+        self._release_bias_tee()
+        self._bias_pool.waitForDone(3000)
+        super().closeEvent(event)
 
     @QtCore.pyqtSlot(float)
     def on_noise_floor_updated(self, value: float):
+        # Keep the value current for detections/CoT, but repaint the labels at
+        # most every 250 ms regardless of the sweep rate.
         self.current_noise_floor = value
-        self.noise_floor_label.setText(f"Noise floor: {value:.1f} dB")
+        if self._noise_label_pending:
+            return
+        # Below the labels' 0.1 dB resolution there is nothing to repaint.
+        shown = self._shown_noise_floor
+        if shown is not None and abs(value - shown) < 0.05:
+            return
+        self._noise_label_pending = True
+        QtCore.QTimer.singleShot(250, QtCore.Qt.CoarseTimer, self._refresh_noise_labels)
+
+    def _refresh_noise_labels(self):
+        self._noise_label_pending = False
+        if self.current_noise_floor is None:
+            return
+        self._shown_noise_floor = self.current_noise_floor
+        self.noise_floor_label.setText(f"Noise floor: {self.current_noise_floor:.1f} dB")
         self.update_effective_threshold_label()
 
-    @QtCore.pyqtSlot(list)
+    @QtCore.pyqtSlot()
+    def _drain_detections(self):
+        buf = self.worker.detection_buffer
+        batch = [buf.popleft() for _ in range(len(buf))]
+        if batch:
+            self.on_detections_found(batch)
+
     def on_detections_found(self, detections: List[Dict[str, Any]]):
-        for d in detections:
-            freq = round(float(d["freq_mhz"]), 6)
-            existing = self.detections.get(freq)
-            if existing is None or float(d["power_dbm"]) > float(existing["power_dbm"]):
-                self.detections[freq] = d
-            else:
-                existing["timestamp"] = d["timestamp"]
+        self.detections.merge(detections, time.monotonic())
+        self._detections_dirty = True
 
         if detections:
+            if not self.update_timer.isActive():
+                self.update_timer.start()
             self.play_alarm_sound()
 
-        for d in detections:
-            try:
-                self.atak_bridge.send_detection(d, noise_floor=self.current_noise_floor)
-            except Exception as e:
-                self.append_log(f"ATAK send error: {e}")
+        if detections and self.atak_bridge.cfg.enabled:
+            if self._cot_in_flight < self.COT_MAX_IN_FLIGHT:
+                self._start_cot_batch(detections)
+            else:
+                # Bounded backlog, oldest first: a stalled network drops stale
+                # markers instead of growing without limit.
+                backlog = self._cot_backlog
+                for d in detections:
+                    key = freq_key_hz(d["freq_mhz"])
+                    backlog.pop(key, None)
+                    backlog[key] = d
+                    if len(backlog) > self.COT_BACKLOG_MAX:
+                        del backlog[next(iter(backlog))]
+                        self._cot_dropped += 1
+
+    def _start_cot_batch(self, detections: List[Dict[str, Any]]):
+        self._cot_in_flight += 1
+        self._cot_pool.start(
+            _CotTask(self.atak_bridge, detections, self.current_noise_floor, self._cot_signals)
+        )
 
-    def refresh_detection_table(self):
-        now = time.time()
-        items = sorted(self.detections.items(), key=lambda kv: kv[1]["timestamp"], reverse=True)
-        self.table.setRowCount(len(items))
+    @QtCore.pyqtSlot(str)
+    def _on_atak_status(self, status: str):
+        self.log("ATAK: %s", status)
 
-        for row, (freq, d) in enumerate(items):
-            age = now - float(d["timestamp"])
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(f"{freq:.6f}"))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(f"{float(d['power_dbm']):.1f}"))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(f"{age:.1f}"))
+    @QtCore.pyqtSlot(str)
+    def _on_cot_error(self, error: str):
+        self.log("ATAK send error: %s", error)
 
+    @QtCore.pyqtSlot()
+    def on_cot_batch_done(self):
+        self._cot_in_flight -= 1
+        if self._cot_dropped:
+            self.log("ATAK: dropped %d queued detections (send backlog full)", self._cot_dropped)
+            self._cot_dropped = 0
+        if self._cot_backlog:
+            detections = list(self._cot_backlog.values())
+            self._cot_backlog.clear()
+            self._start_cot_batch(detections)
+
+    @QtCore.pyqtSlot()
+    def refresh_detection_table(self):
+        now = time.monotonic()
+        # Entries not seen for DETECTION_MAX_AGE_S leave the table, so the
+        # store stays bounded over long sessions.
+        self.detections.prune(now - self.DETECTION_MAX_AGE_S)
+        # Without new merges since the last tick only the ages move.
+        reorder = self._detections_dirty or self.detection_model.rowCount() != len(self.detections)
+        self._detections_dirty = False
+        self.detection_model.refresh(now, reorder)
+
+    @QtCore.pyqtSlot(str)
     def append_log(self, text: str):
+        self.log(text)
+
+    def log(self, fmt: str, *args):
+        """Queue a log line; `fmt % args` is only built if the line gets written."""
+        self._log_queue.append((fmt, args))
+        if not self.log_timer.isActive():
+            self.log_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _flush_log(self):
+        if not self._log_queue:
+            return
+        # Take the entries first, so a bad line cannot wedge every later flush.
+        entries = list(self._log_queue)
+        self._log_queue.clear()
+        text = "\n".join(self._format_log_line(fmt, args) for fmt, args in entries)
         self.log_edit.append(text)
         self.log_edit.moveCursor(QtGui.QTextCursor.End)
 
+    @staticmethod
+    def _format_log_line(fmt: str, args: tuple) -> str:
+        if not args:
+            return fmt
+        try:
+            return fmt % args
+        except (TypeError, ValueError):
+            return f"{fmt} {args}"
+
+    @QtCore.pyqtSlot()
     def clear_log(self):
+        self._log_queue.clear()
         self.log_edit.clear()
 
+    @QtCore.pyqtSlot(bool)
     def apply_dark_mode(self, enabled: bool):
-        if enabled:
-            self.setStyleSheet(
-                """
-                QWidget { background-color: #222; color: #eee; }
-                QGroupBox { border: 1px solid #444; margin-top: 6px; }
-                QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 3px 0 3px; }
-                QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QTextEdit, QTableWidget {
-                    background-color: #333; color: #eee; border: 1px solid #555;
-                }
-                QHeaderView::section { background-color: #333; color: #eee; }
-                QPushButton { background-color: #444; color: #eee; border: 1px solid #666; padding: 3px 8px; }
-                QPushButton:disabled { background-color: #333; color: #777; }
-                """
-            )
-        else:
-            self.setStyleSheet("")
+        enabled = bool(enabled)
+        if enabled == self._dark_active:
+            return
+        self._dark_active = enabled
+
+        # One repaint for the whole restyle instead of one per re-polished widget.
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(_DARK_SS if enabled else _LIGHT_SS)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 def main():
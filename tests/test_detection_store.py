@@ -0,0 +1,119 @@
+import copy
+import random
+import unittest
+
+import numpy as np
+
+from hackrf_watchdog.detection_store import DetectionStore, _strongest_per_key, freq_key_hz
+
+
+class NaiveStore:
+    """One-by-one dict merge the vectorized store must agree with."""
+
+    def __init__(self):
+        # key -> [power, seen, detection]; dict order = row order
+        self.rows = {}
+
+    def merge(self, detections, seen):
+        for d in detections:
+            key = freq_key_hz(d["freq_mhz"])
+            row = self.rows.get(key)
+            if row is None:
+                self.rows[key] = [d["power_dbm"], seen, d]
+            elif d["power_dbm"] > row[0]:
+                row[:] = [d["power_dbm"], seen, d]
+            else:
+                row[1] = seen
+                row[2]["timestamp"] = d["timestamp"]
+
+    def prune(self, cutoff):
+        stale = [k for k, row in self.rows.items() if row[1] < cutoff]
+        for k in stale:
+            del self.rows[k]
+        return len(stale)
+
+    def newest_first(self):
+        return sorted(self.rows, key=lambda k: -self.rows[k][1])
+
+
+def det(freq_mhz, power_dbm, timestamp):
+    return {"freq_mhz": freq_mhz, "power_dbm": power_dbm, "timestamp": timestamp}
+
+
+class DetectionStoreTest(unittest.TestCase):
+    def assertMatches(self, store, naive):
+        self.assertEqual(len(store), len(naive.rows))
+        order = store.newest_first()
+        self.assertEqual(store.freqs_hz[order].tolist(), naive.newest_first())
+        for i, key in enumerate(store.freqs_hz.tolist()):
+            power, seen, d = naive.rows[key]
+            self.assertEqual(float(store.powers[i]), power)
+            self.assertEqual(float(store.timestamps[i]), seen)
+            self.assertEqual(store.info[i], d)
+
+    def test_matches_naive_merge_and_prune(self):
+        rng = random.Random(1234)
+        store, naive = DetectionStore(capacity=4), NaiveStore()
+        wall = 0.0
+        for seen in range(1, 400):
+            burst = []
+            for _ in range(rng.randint(0, 30)):
+                wall += 0.01
+                # Few frequencies and coarse powers: repeats and ties within
+                # a burst are common. Powers are exact in float32.
+                burst.append(det(900 + rng.randint(0, 40) * 0.0125, rng.randint(-12, 0) * 5.0, wall))
+            store.merge(copy.deepcopy(burst), float(seen))
+            naive.merge(copy.deepcopy(burst), float(seen))
+            if seen % 9 == 0:
+                self.assertEqual(store.prune(seen - 20.0), naive.prune(seen - 20.0))
+            self.assertMatches(store, naive)
+
+    def test_equal_power_keeps_first_hit_and_last_timestamp(self):
+        first = det(915.0, -30.0, 1.0)
+        store = DetectionStore()
+        store.merge([first, det(915.0, -30.0, 2.0), det(915.0, -40.0, 3.0)], 10.0)
+        self.assertEqual(len(store), 1)
+        self.assertIs(store.info[0], first)
+        self.assertEqual(first["timestamp"], 3.0)
+
+    def test_stronger_hit_later_in_burst_wins(self):
+        first = det(915.0, -30.0, 1.0)
+        stronger = det(915.0, -20.0, 2.0)
+        store = DetectionStore()
+        store.merge([first, stronger, det(915.0, -25.0, 3.0)], 10.0)
+        self.assertIs(store.info[0], stronger)
+        self.assertEqual(stronger["timestamp"], 3.0)
+        self.assertEqual(float(store.powers[0]), -20.0)
+
+    def test_newest_first_ties_by_row(self):
+        store = DetectionStore()
+        store.merge([det(900.0, -30.0, 1.0), det(901.0, -30.0, 1.0)], 1.0)
+        store.merge([det(902.0, -30.0, 2.0), det(900.0, -50.0, 2.0)], 2.0)
+        self.assertEqual(store.freqs_hz[store.newest_first()].tolist(), [900_000_000, 902_000_000, 901_000_000])
+
+    def test_prune_compacts_rows(self):
+        store = DetectionStore()
+        store.merge([det(900.0, -30.0, 1.0), det(901.0, -30.0, 1.0)], 1.0)
+        store.merge([det(902.0, -30.0, 2.0)], 2.0)
+        self.assertEqual(store.prune(1.5), 2)
+        self.assertEqual(store.prune(1.5), 0)
+        self.assertEqual(store.freqs_hz.tolist(), [902_000_000])
+        self.assertEqual(store.newest_first().tolist(), [0])
+        store.merge([det(900.0, -10.0, 3.0)], 3.0)
+        self.assertEqual(store.freqs_hz[store.newest_first()].tolist(), [900_000_000, 902_000_000])
+
+    def test_strongest_per_key(self):
+        burst = [det(901.0, -30.0, 0), det(900.0, -40.0, 0), det(901.0, -20.0, 0), det(901.0, -20.0, 0), det(900.0, -50.0, 0)]
+        keys, best, last = _strongest_per_key(burst)
+        self.assertEqual(keys.tolist(), [901_000_000, 900_000_000])
+        self.assertEqual(best.tolist(), [2, 1])
+        self.assertEqual(last.tolist(), [3, 4])
+
+    def test_key_rounding_matches_freq_key_hz(self):
+        freqs = np.random.default_rng(7).uniform(1.0, 6000.0, 500).tolist() + [915.0000005, 915.0000015]
+        keys, _, _ = _strongest_per_key([det(f, 0.0, 0) for f in freqs])
+        self.assertEqual(sorted(keys.tolist()), sorted({freq_key_hz(f) for f in freqs}))
+
+
+if __name__ == "__main__":
+    unittest.main()